@@ -1,19 +1,48 @@
+import csv
+import logging
 import pandas as pd
 import subprocess
+import threading
 import time
 import sqlite3
-from contextlib import contextmanager
-from multiprocessing import Pool, current_process, cpu_count
+from contextlib import contextmanager, suppress
+import sys
+from multiprocessing import current_process, cpu_count, get_context
 import traceback
-import concurrent.futures
+import functools
 import os
 import json
+import mmap
 import re
 from pathlib import Path
 from typing import Any, Dict, Tuple, Union
 import warnings
 warnings.filterwarnings("ignore")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+    pyarrow_csv = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 
 """
 FACTORY.PY - The Engine(monolith) of AIpomoea
@@ -93,8 +122,15 @@ Parallel Execution:
 DEBUG = False
 PERFORM_BENCHMARK = False
 
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.DEBUG if DEBUG else logging.WARNING)
+
 pd.options.mode.chained_assignment = None  # Suppress SettingWithCopyWarning
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
+ALLOWED_SUFFIXES = tuple(f'.{ext}' for ext in ALLOWED_EXTENSIONS)
+RESULT_LINE_RE = re.compile(r'^(.*?): (.*?) Result: (.*)$')
+SMALL_EXPORT_THRESHOLD = 256  # Below this many result rows, exports skip pandas entirely
+STAR_STRIP_TABLE = str.maketrans('', '', '*')
 UPLOAD_FOLDER_BUILD = Path('./uploads').resolve()
 UPLOAD_FOLDER_DIST = Path('./resources/app/uploads').resolve()
 RECIPE_PATH_BUILD = Path('./recipe.json').resolve()
@@ -107,6 +143,100 @@ CUSTOM_PRELOADING_PATH_BUILD = Path('./custom_preloading.json').resolve()
 CUSTOM_PRELOADING_PATH_DIST = Path('./resources/app/custom_preloading.json').resolve()
 
 
+def _resolve_paths():
+    """
+    Resolves each BUILD/DIST path pair once at import time.
+
+    Returns:
+        dict: Maps a logical name to the first existing candidate path,
+        or None when neither candidate exists. Consumers raise their own
+        FileNotFoundError codes for missing entries.
+    """
+    resolved = {}
+    for key, build, dist in (
+        ('uploads', UPLOAD_FOLDER_BUILD, UPLOAD_FOLDER_DIST),
+        ('recipe', RECIPE_PATH_BUILD, RECIPE_PATH_DIST),
+        ('models_dir', MODELS_PATH_BUILD, MODELS_PATH_DIST),
+        ('models_file', MODELS_PATH_BUILD / 'models.json', MODELS_PATH_DIST / 'models.json'),
+        ('config', CONFIG_PATH_BUILD, CONFIG_PATH_DIST),
+        ('preloading', CUSTOM_PRELOADING_PATH_BUILD, CUSTOM_PRELOADING_PATH_DIST),
+    ):
+        if build.exists():
+            resolved[key] = build
+        elif dist.exists():
+            resolved[key] = dist
+        else:
+            resolved[key] = None
+    return resolved
+
+
+_PATHS = _resolve_paths()
+
+
+def _load_json_file(path):
+    """
+    Parses a JSON file, preferring orjson's native parser when installed.
+
+    Parameters:
+        - path (str or Path): Location of the JSON file.
+    Returns:
+        - Any: The parsed JSON content.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Factory copy shared by all tasks of a pool worker. Set once per worker by
+# _init_worker so task payloads stay small (a command name or batch tuple)
+# instead of re-pickling the Factory, with its images dict, per task.
+_WORKER_FACTORY = None
+
+
+def _init_worker(factory):
+    """Pool initializer: installs the worker's shared Factory copy."""
+    global _WORKER_FACTORY
+    _WORKER_FACTORY = factory
+
+
+def _worker_execute_command(command):
+    """Runs one command on the worker's shared Factory."""
+    return _WORKER_FACTORY._execute_command(command)
+
+
+def _worker_execute_batch(task):
+    """Runs one (command, batch) unit on the worker's shared Factory."""
+    return _WORKER_FACTORY._execute_batch(task)
+
+
+def _physical_cpu_count():
+    """
+    Returns the number of physical cores, falling back to the logical count.
+
+    The model binaries are compute-heavy native processes; scheduling one per
+    SMT sibling makes them fight over the same caches, so the pool is sized
+    to physical cores when psutil can report them.
+    """
+    if psutil is not None:
+        physical = psutil.cpu_count(logical=False)
+        if physical:
+            return physical
+    return cpu_count()
+
+
+@functools.lru_cache(maxsize=None)
+def _binary_path_for(command, models_dir):
+    """
+    Resolves the binary path for a command inside the models directory.
+
+    Memoized so repeated lookups for the same command cost a dict hit
+    instead of a path resolution per call.
+    """
+    return os.path.join(Path(models_dir).resolve(), command + ".exe")
+
+
 class Model:
     """
     A class representing a model and model-related operations.
@@ -121,15 +251,9 @@ class Model:
     """
     def __init__(self):
         self.models = {}
-        try:
-            if os.path.exists(os.path.join(MODELS_PATH_BUILD, 'models.json')):
-                self.models_file = os.path.join(MODELS_PATH_BUILD, 'models.json')
-            elif os.path.exists(os.path.join(MODELS_PATH_DIST, 'models.json')):
-                self.models_file = os.path.join(MODELS_PATH_DIST, 'models.json')
-            else:
-                print("Models file not found.")
-        except Exception as e:
-            print(f"Error while loading models: {e}")
+        self.models_file = _PATHS['models_file']
+        if self.models_file is None:
+            print("Models file not found.")
         self.model_definitions = {}
         self.load_models()
 
@@ -143,12 +267,13 @@ class Model:
         Example:
             - self.load_models()  # Assuming self.models_file is a JSON file containing model definitions
         """
-        with open(self.models_file, 'r') as file:
-            data = json.load(file)
-            for model in data['models']:
-                if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', model['name']):
-                    raise ValueError(f"invalid model name: {model['name']}")
-                self.model_definitions[model['name']] = model['path']
+        data = _load_json_file(self.models_file)
+        for model in data['models']:
+            # ASCII identifiers match the regex grammar exactly, without regex overhead.
+            name = model['name']
+            if not (name.isascii() and name.isidentifier()):
+                raise ValueError(f"invalid model name: {name}")
+            self.model_definitions[name] = model['path']
 
     # TODO Add compatibility to work with tf.model execution as it was before if user wants to use it.
     # def exec_model(self, model_name):
@@ -164,13 +289,12 @@ class Model:
 
 class Utils:
     """
-    Utils class provides utility methods for benchmarking code execution time and safely changing directories.
+    Utils class provides utility methods for benchmarking code execution time.
     Methods:
         __init__():
         benchmark():
         end_benchmark():
         benchmark_time(description="Operation"):
-        change_directory(new_path):
     """
 
     def __init__(self):
@@ -183,6 +307,7 @@ class Utils:
         """
         self.start_time = None
         self.write_logs = True
+        self._log_file = None  # Line-buffered benchmark.log handle, opened on first write
 
     def benchmark(self):
         """
@@ -194,7 +319,7 @@ class Utils:
         Returns:
             None
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
 
     def end_benchmark(self):
         """
@@ -204,9 +329,9 @@ class Utils:
         Prints the elapsed time in seconds with 6 decimal places.
         If the start time is not set, prints a message indicating that the benchmark start time is not set.
         """
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         if self.start_time is not None:
-            elapsed_time = end_time - self.start_time
+            elapsed_time = (end_time - self.start_time) / 1e9
             print(f"Benchmark completed in {elapsed_time:.6f} seconds.")
         else:
             print("Benchmark start time is not set.")
@@ -239,37 +364,16 @@ class Utils:
         finally:
             self.end_benchmark()
             if self.start_time is not None:
-                message = (f"{description} completed in {time.time() - self.start_time:.6f} seconds.")
+                elapsed = (time.perf_counter_ns() - self.start_time) / 1e9
+                message = (f"{description} completed in {elapsed:.6f} seconds.")
                 print(message)
                 if self.write_logs:
-                    with open("benchmark.log", "a") as file:
-                        file.write(message + "\n")
+                    if self._log_file is None:
+                        self._log_file = open("benchmark.log", "a", buffering=1)
+                    self._log_file.write(message + "\n")
             else:
                 print("Benchmark start time is not set.")
 
-    @contextmanager
-    def change_directory(self, new_path):
-        """
-            Context manager to safely change directories.
-
-            This context manager allows you to safely change directories by temporarily changing the current working directory to the specified `new_path`. It ensures that the original working directory is restored after the code block inside the context manager is executed or an exception is raised.
-
-            Parameters:
-            - `new_path`: The new directory path to change to.
-
-            Usage:
-            new_path = '/caminho/para/novo/diretorio'
-            with change_directory(new_path):
-                # Code to be executed in the new directory.
-
-        """
-        self.ocwd = os.getcwd()
-        os.chdir(new_path)
-        try:
-            yield
-        finally:
-            os.chdir(self.ocwd)
-
 
 class Recipe:
     """
@@ -288,15 +392,16 @@ class Recipe:
     _decompose_commands(commands: Dict[str, bool]) -> Tuple[Dict[str, bool], Dict[str, bool], Dict[str, bool]]: Decomposes the commands into three categories: general commands, command specifications, and export formats.
 
     """
+    EXPORT_FORMATS = frozenset({'csv', 'json', 'pdf', 'connected_database'})
+    COMMANDS_SPEC = frozenset({'white_background', 'export_separation'})
+
     def __init__(self):
         """
         Initializes the Recipe instance by setting the recipe path.
         """
-        self.EXPORT_FORMATS = {'csv', 'json', 'pdf', 'connected_database'}
-        self.COMMANDS_SPEC = {'white_background', 'export_separation'}
+        self._recipe_cache = None
         self.recipe_path = self._determine_recipe_path()
-        if DEBUG:
-            print(f"DEBUG - Recipe path determined: {self.recipe_path}")
+        logger.debug("Recipe path determined: %s", self.recipe_path)
 
     def _determine_recipe_path(self) -> Path:
         """
@@ -308,16 +413,11 @@ class Recipe:
         Raises:
             FileNotFoundError: If the recipe file is not found in either path.
         """
-        if RECIPE_PATH_BUILD.exists():
-            if DEBUG:
-                print(f"DEBUG - Using recipe path: {RECIPE_PATH_BUILD}")
-            return RECIPE_PATH_BUILD
-        elif RECIPE_PATH_DIST.exists():
-            if DEBUG:
-                print(f"DEBUG - Using recipe path: {RECIPE_PATH_DIST}")
-            return RECIPE_PATH_DIST
-        if DEBUG:
-            print("DEBUG - Recipe file not found in both paths.")
+        recipe_path = _PATHS['recipe']
+        if recipe_path is not None:
+            logger.debug("Using recipe path: %s", recipe_path)
+            return recipe_path
+        logger.debug("Recipe file not found in both paths.")
         raise FileNotFoundError("FINIT2 - Recipe not found.")
 
     def load_recipe(self) -> Dict[str, Any]:
@@ -331,17 +431,16 @@ class Recipe:
         Raises:
             Exception: If there's an issue reading or parsing the recipe file.
         """
+        if self._recipe_cache is not None:
+            return self._recipe_cache
         try:
-            if DEBUG:
-                print(f"DEBUG - Loading recipe from path: {self.recipe_path}")
-            with self.recipe_path.open('r', encoding='utf-8') as file:
-                content = json.load(file)
-                if DEBUG:
-                    print(f"DEBUG - Recipe content loaded: {content}")
-                checkbox_states = content.get('checkboxStates', {})
-                if DEBUG:
-                    print(f"DEBUG - Checkbox states extracted: {checkbox_states}")
-                return self._process_recipe(checkbox_states)
+            logger.debug("Loading recipe from path: %s", self.recipe_path)
+            content = _load_json_file(self.recipe_path)
+            logger.debug("Recipe content loaded: %s", content)
+            checkbox_states = content.get('checkboxStates', {})
+            logger.debug("Checkbox states extracted: %s", checkbox_states)
+            self._recipe_cache = self._process_recipe(checkbox_states)
+            return self._recipe_cache
         except (json.JSONDecodeError, IOError) as e:
             print(f"FLRE1- Error while loading recipe: {e}")
             raise
@@ -357,13 +456,11 @@ class Recipe:
         Returns:
             dict: A dictionary with categorized commands, commands_spec, and exportation_format.
         """
-        if DEBUG:
-            print(f"DEBUG - Processing checkbox states: {checkbox_states}")
+        logger.debug("Processing checkbox states: %s", checkbox_states)
         commands, commands_spec, exportation_format = self._decompose_commands(checkbox_states)
-        if DEBUG:
-            print(f"DEBUG - Commands: {commands}")
-            print(f"DEBUG - Command specs: {commands_spec}")
-            print(f"DEBUG - Exportation formats: {exportation_format}")
+        logger.debug("Commands: %s", commands)
+        logger.debug("Command specs: %s", commands_spec)
+        logger.debug("Exportation formats: %s", exportation_format)
         return {
             "commands": commands,
             "commands_spec": commands_spec,
@@ -386,18 +483,19 @@ class Recipe:
         general_commands = {}
         command_specs = {}
         export_formats = {}
+        export_format_names = self.EXPORT_FORMATS
+        command_spec_names = self.COMMANDS_SPEC
         for command, value in commands.items():
             normalized_command = command.replace("-", "_")
-            if normalized_command in self.EXPORT_FORMATS:
+            if normalized_command in export_format_names:
                 export_formats[normalized_command] = value
-            elif normalized_command in self.COMMANDS_SPEC:
+            elif normalized_command in command_spec_names:
                 command_specs[normalized_command] = value
             else:
                 general_commands[normalized_command] = value
-        if DEBUG:
-            print(f"DEBUG - Decomposed commands: {general_commands}")
-            print(f"DEBUG - Decomposed command specs: {command_specs}")
-            print(f"DEBUG - Decomposed export formats: {export_formats}")
+        logger.debug("Decomposed commands: %s", general_commands)
+        logger.debug("Decomposed command specs: %s", command_specs)
+        logger.debug("Decomposed export formats: %s", export_formats)
         return general_commands, command_specs, export_formats
 
 
@@ -414,50 +512,50 @@ class ResultsExporter:
         self.output_folder = output_folder
         self.separate_exports = separate_exports
 
-    def export_results(self, results_dict):
+    def export_results(self, results_df):
         """
         Exports results in specified formats, optionally separating them by a configured position.
 
         Parameters:
-            results_dict (dict): Dictionary of results to export, keyed by image names with associated data.
+            results_df (pd.DataFrame): Long-form results to export, with 'image', 'model' and 'result' columns.
 
         Returns:
             None
         """
         try:
-            if DEBUG:
-                print("DEBUG - Starting export_results method.")
-                print(f"DEBUG - Results to export: {results_dict}")
+            logger.debug("Starting export_results method.")
+            logger.debug("Results to export: %s", results_df)
 
             position = self.separate_exports - 1 if self.separate_exports else None
 
             if position is not None:
-                if DEBUG:
-                    print(f"DEBUG - Exporting results with separation at position {position}.")
+                logger.debug("Exporting results with separation at position %s.", position)
 
                 try:
-                    separated_results = self._group_results_by_position(results_dict, position)
+                    base_names = results_df['image'].str.split(r'[_-]').str[position]
                 except Exception as group_error:
                     print(f"REXEXR2 - Error while grouping results by position: {group_error}")
                     raise group_error
 
-                if DEBUG:
-                    print(f"DEBUG - Grouped results: {separated_results}")
-
-                if separated_results:
-                    for base_name, grouped_results in separated_results.items():
-                        if DEBUG:
-                            print(f"DEBUG - Exporting results for base name: {base_name}")
-                        try:
-                            self._export_to_formats(base_name, grouped_results)
-                        except Exception as export_error:
-                            print(f"REXEXR3 - Error while exporting grouped results for base name '{base_name}': {export_error}")
-                            raise export_error
+                invalid = base_names.isna()
+                for image in results_df.loc[invalid, 'image'].unique():
+                    print(f"GRBB2 - Invalid position {position} for image '{image}'. Skipping this image.")
+
+                # Categorical codes make the groupby hash small ints instead of
+                # strings; observed=True skips categories emptied by the
+                # invalid-row mask.
+                base_names = base_names.astype('category')
+                for base_name, grouped_results in results_df[~invalid].groupby(base_names[~invalid], sort=False, observed=True):
+                    logger.debug("Exporting results for base name: %s", base_name)
+                    try:
+                        self._export_to_formats(base_name, grouped_results)
+                    except Exception as export_error:
+                        print(f"REXEXR3 - Error while exporting grouped results for base name '{base_name}': {export_error}")
+                        raise export_error
             else:
-                if DEBUG:
-                    print("DEBUG - No separation position provided. Exporting all results together.")
+                logger.debug("No separation position provided. Exporting all results together.")
                 try:
-                    self._export_to_formats("results", results_dict)
+                    self._export_to_formats("results", results_df)
                 except Exception as export_error:
                     print(f"REXEXR4 - Error while exporting non-separated results: {export_error}")
                     raise export_error
@@ -466,82 +564,40 @@ class ResultsExporter:
             print(f"REXEXR1 - Error in export_results method: {e}")
             raise e
 
-    def _group_results_by_position(self, results_dict, position):
-        """
-        Groups results by the specified position in the image name.
-
-        Parameters:
-            results_dict (dict): Original results dictionary keyed by image names.
-            position (int): Position to use for grouping the results (0-based index).
-
-        Returns:
-            dict: Dictionary where each key is a base name, and each value is a dictionary of results.
-        """
-        try:
-            if DEBUG:
-                print("DEBUG - Starting _group_results_by_position method.")
-                print(f"DEBUG - Position for grouping: {position}")
-                print(f"DEBUG - Results to group: {results_dict}")
-
-            separated_results = {}
-
-            for image, data in results_dict.items():
-                try:
-                    parts = re.split(r'[_-]', image)
-                    if len(parts) > position:
-                        base_name = parts[position]
-                        if base_name not in separated_results:
-                            separated_results[base_name] = {}
-                        separated_results[base_name][image] = data
-                    else:
-                        print(f"GRBB2 - Invalid position {position} for image '{image}'. Skipping this image.")
-                except Exception as grouping_error:
-                    print(f"GRBB3 - Error processing image '{image}': {grouping_error}")
-                    raise grouping_error
-
-            if DEBUG:
-                print(f"DEBUG - Grouped results: {separated_results}")
-
-            return separated_results
-
-        except Exception as e:
-            print(f"GRBB1 - Error in _group_results_by_position method: {e}")
-            raise e
-
     def _export_to_formats(self, base_name, results_data):
         """
         Exports data in all specified formats (CSV, JSON).
 
         Parameters:
             base_name (str): Name to use as the base of the output filename.
-            results_data (dict): Dictionary of results keyed by image with associated data.
+            results_data (pd.DataFrame): Long-form results with 'image', 'model' and 'result' columns.
 
         Returns:
             None
         """
         try:
-            if DEBUG:
-                print(f"DEBUG - Starting export for base name: {base_name}")
-                print(f"DEBUG - Results data: {results_data}")
-
-            rows = []
-            for image, data in results_data.items():
-                if isinstance(data, dict):
-                    rows.extend((image, model, result) for model, result in data.items())
-                else:
-                    print(f"REXFOR3 - Unexpected data format for image '{image}': {data}")
+            logger.debug("Starting export for base name: %s", base_name)
+            logger.debug("Results data: %s", results_data)
 
-            if not rows:
+            if results_data.empty:
                 print(f"REXFOR4 - No valid data to export for base name '{base_name}'")
                 raise ValueError(f"No valid data to export for base name '{base_name}'")
 
-            results_df = pd.DataFrame(rows, columns=['image', 'model', 'result']).pivot(
+            if len(results_data) < SMALL_EXPORT_THRESHOLD:
+                self._export_small(base_name, results_data)
+                print("done")
+                return
+
+            # Different source extensions collapse to the same image stem, so
+            # duplicate (image, model) pairs are valid input; keep the last
+            # value like the nested-dict build always did -- pivot would raise.
+            results_df = results_data.drop_duplicates(
+                subset=['image', 'model'], keep='last'
+            ).pivot(
                 index='image', columns='model', values='result'
-            ).reset_index()
+            ).reset_index().rename_axis(columns=None)
 
-            if DEBUG:
-                print("DEBUG - DataFrame created for export:")
-                print(results_df.head())
+            logger.debug("DataFrame created for export:\n%s", results_df.head())
 
             for format_name, enabled in self.exportation_formats.items():
                 if enabled:
@@ -567,6 +623,52 @@ class ResultsExporter:
             print(f"REXFOR1 - Unexpected error during export: {e}")
             raise e
 
+    def _export_small(self, base_name, results_data):
+        """
+        Exports a small result set with the stdlib csv/json writers.
+
+        For result sets below SMALL_EXPORT_THRESHOLD rows, the constant
+        per-column overhead of the pandas pivot dominates, so the wide table
+        is assembled from a nested dict and written directly.
+
+        Parameters:
+            base_name (str): Name to use as the base of the output filename.
+            results_data (pd.DataFrame): Long-form results with 'image', 'model' and 'result' columns.
+
+        Returns:
+            None
+        """
+        results_dict = {}
+        for image, model, result in results_data.itertuples(index=False, name=None):
+            results_dict.setdefault(image, {})[model] = result
+        all_models = sorted({model for data in results_dict.values() for model in data})
+
+        for format_name, enabled in self.exportation_formats.items():
+            if not enabled:
+                continue
+            if format_name == 'csv':
+                with open(f"{self.output_folder}/{base_name.lower()}.csv", 'w', newline='') as csv_file:
+                    writer = csv.writer(csv_file)
+                    writer.writerow(['image', *all_models])
+                    writer.writerows(
+                        [image, *(data.get(model, '') for model in all_models)]
+                        for image, data in results_dict.items()
+                    )
+            elif format_name == 'json':
+                records = [
+                    {'image': image, **{model: data.get(model) for model in all_models}}
+                    for image, data in results_dict.items()
+                ]
+                output_path = f"{self.output_folder}/{base_name.lower()}.json"
+                if orjson is not None:
+                    with open(output_path, 'wb') as json_file:
+                        json_file.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(output_path, 'w') as json_file:
+                        json.dump(records, json_file, indent=4)
+            else:
+                print(f"REXFOR6 - No valid export method found for format: {format_name}")
+
     def _export_to_csv(self, base_name, results_df):
         """
         Exports results DataFrame to a CSV file.
@@ -575,8 +677,15 @@ class ResultsExporter:
             - results_df (pd.DataFrame): DataFrame containing the results.
         """
         try:
-
-            results_df.to_csv(f"{self.output_folder}/{base_name.lower()}.csv", index=False)
+            output_path = f"{self.output_folder}/{base_name.lower()}.csv"
+            if pyarrow is not None:
+                # Arrow's C++ writer formats cells without Python-level work
+                # and releases the GIL for the duration.
+                table = pyarrow.Table.from_pandas(results_df, preserve_index=False)
+                pyarrow_csv.write_csv(table, output_path)
+            else:
+                with open(output_path, 'w', buffering=1 << 20, newline='') as csv_file:
+                    results_df.to_csv(csv_file, index=False)
         except Exception as e:
             print(f"CSVEX - Error while exporting {base_name} to CSV: {e}")
 
@@ -588,12 +697,21 @@ class ResultsExporter:
             - results_df (pd.DataFrame): DataFrame containing the results.
         """
         try:
-            results_json_list = [
-                {"image": row["image"], **row.drop("image").to_dict()}
-                for _, row in results_df.iterrows()
-            ]
-            with open(f"{self.output_folder}/{base_name.lower()}.json", 'w') as json_file:
-                json.dump(results_json_list, json_file, indent=4)
+            output_path = f"{self.output_folder}/{base_name.lower()}.json"
+            if orjson is not None:
+                records = results_df.to_dict(orient='records')
+                with open(output_path, 'wb') as json_file:
+                    json_file.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+            else:
+                # Stream one record per row so peak memory stays at a single
+                # row instead of a full list-of-dicts copy of the frame.
+                columns = list(results_df.columns)
+                with open(output_path, 'w', buffering=1 << 20) as json_file:
+                    json_file.write('[')
+                    for index, row in enumerate(results_df.itertuples(index=False, name=None)):
+                        json_file.write(',\n' if index else '\n')
+                        json.dump(dict(zip(columns, row)), json_file)
+                    json_file.write('\n]')
         except Exception as e:
             print(f"JSONEX - Error while exporting {base_name} to JSON: {e}")
 
@@ -650,14 +768,10 @@ class Factory:
             FileNotFoundError: If any of the required files or folders are not found.
         """
 
-        if (UPLOAD_FOLDER_BUILD).exists():
-            self.upload_folder = UPLOAD_FOLDER_BUILD
-        elif (UPLOAD_FOLDER_DIST).exists():
-            self.upload_folder = UPLOAD_FOLDER_DIST
-        else:
-            if DEBUG:
-                print("DEBUG - Upload folder not found.")
-                print(f"DEBUG - nor {UPLOAD_FOLDER_BUILD} or {UPLOAD_FOLDER_DIST} exists.")
+        self.upload_folder = _PATHS['uploads']
+        if self.upload_folder is None:
+            logger.debug("Upload folder not found.")
+            logger.debug("nor %s or %s exists.", UPLOAD_FOLDER_BUILD, UPLOAD_FOLDER_DIST)
             raise FileNotFoundError("FINIT1 - Images folder not found.")
 
         recipe = Recipe()
@@ -667,39 +781,148 @@ class Factory:
         self.exportation_formats = recipe_content['exportation_format']
         self.ocwd = os.getcwd()
 
-        if (MODELS_PATH_BUILD).exists():
-            self.models_path = MODELS_PATH_BUILD
-        elif (MODELS_PATH_DIST).exists():
-            self.models_path = MODELS_PATH_DIST
-        else:
+        self.models_path = _PATHS['models_dir']
+        if self.models_path is None:
             raise FileNotFoundError("FINIT3 - Models folder not found.")
+        self._models_dir_str = str(self.models_path)
+        # One scan of the models folder replaces per-command path probes; the
+        # dict is picklable and travels to pool workers for free.
+        self._binary_index = {}
+        try:
+            with os.scandir(self.models_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith('.exe'):
+                        self._binary_index[entry.name[:-4]] = entry.path
+        except OSError:
+            pass
 
-        if (CONFIG_PATH_BUILD).exists():
-            self.config_path = CONFIG_PATH_BUILD
-        elif (CONFIG_PATH_DIST).exists():
-            self.config_path = CONFIG_PATH_DIST
-        else:
+        self.config_path = _PATHS['config']
+        if self.config_path is None:
             raise FileNotFoundError("FINIT4 - Config file not found.")
 
-        if (CUSTOM_PRELOADING_PATH_BUILD).exists():
-            self.custom_preloading_path = CUSTOM_PRELOADING_PATH_BUILD
-        elif (CUSTOM_PRELOADING_PATH_DIST).exists():
-            self.custom_preloading_path = CUSTOM_PRELOADING_PATH_DIST
-        else:
+        self.custom_preloading_path = _PATHS['preloading']
+        if self.custom_preloading_path is None:
             raise FileNotFoundError("FINIT5 - Custom preloading file not found.")
 
+        self._json_cache: Dict[str, Tuple[int, dict]] = {}
+        self._config = None
+        self._output_folder = None
+        self._allowed_prefixes = ()
+        self._excluded_prefixes = ()
         self.images = {}
         self.preloading()
         self.load_images()
-        self.results = pd.DataFrame()
-        self.models = Model()
+        self._image_paths = tuple(self.images.values())
         self.db_conn = None
         self.db_cursor = None
-        self.batch_size = 50  # Batch size for parallel execution
+        self._db_columns = None
+        self._workers = {}  # Long-lived worker process per command, when enabled
+        self._pool = None  # Persistent multiprocessing pool, created on first use
+        try:
+            # Larger batches amortize model startup across more images; with a
+            # high enough value every image goes to the binary in one call.
+            self.batch_size = int(self.load_config().get('BATCH_SIZE', 50))
+        except Exception:
+            self.batch_size = 50  # Batch size for parallel execution
+        self._batch_calibrated = False
 
         if PERFORM_BENCHMARK:  # Benchmarking flag
             self.utils = Utils()
 
+    @functools.cached_property
+    def models(self):
+        """
+        The Model registry, constructed on first access.
+
+        Recipes that never consult the registry (binary resolution goes
+        through the scandir index) skip the models.json parse entirely.
+        """
+        return Model()
+
+    def __getstate__(self):
+        # Worker processes receive a pickled copy of the Factory; live process
+        # handles and database connections must not cross that boundary.
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_workers'] = {}
+        state['db_conn'] = None
+        state['db_cursor'] = None
+        return state
+
+    def _get_pool(self, num_processes):
+        """
+        Returns the persistent worker pool, creating it on first use.
+        Parameters:
+            - num_processes (int): Number of worker processes for the pool.
+        Returns:
+            - multiprocessing.pool.Pool: The long-lived pool instance.
+        """
+        if self._pool is None:
+            # fork copies the already-warm parent address space, skipping the
+            # module re-import that spawn pays per worker; Windows has no fork.
+            ctx = get_context('fork' if sys.platform != 'win32' else 'spawn')
+            self._pool = ctx.Pool(processes=num_processes, initializer=_init_worker, initargs=(self,))
+        return self._pool
+
+    def shutdown(self):
+        """
+        Releases the persistent pool and any long-lived model workers.
+
+        Safe to call multiple times; also invoked from __del__ so repeated
+        runs do not leak worker processes.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for proc in self._workers.values():
+            if proc.poll() is None:
+                proc.terminate()
+        self._workers.clear()
+
+    def __del__(self):
+        try:
+            self.shutdown()
+        except Exception:
+            pass
+
+    def _read_json(self, path):
+        """
+        Reads and parses a JSON file, memoizing the parsed content per path.
+        Parameters:
+            - path (Path): The path of the JSON file to read.
+        Returns:
+            - dict: The parsed content of the JSON file.
+        Example:
+            - self._read_json(self.config_path) -> {'setting1': 'value1'}
+
+        The cache is keyed by the file's mtime, so each file is read and decoded
+        at most once per run unless it changes on disk.
+        """
+        key = str(path)
+        stat = os.stat(path)
+        cached = self._json_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns:
+            return cached[1]
+        with open(path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file or platform without mmap support; read normally.
+                buffer = file.read()
+            try:
+                if orjson is not None:
+                    # orjson rejects mmap objects; a memoryview parses the
+                    # mapped pages without copying them.
+                    content = orjson.loads(memoryview(buffer))
+                else:
+                    content = json.loads(bytes(buffer))
+            finally:
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+        self._json_cache[key] = (stat.st_mtime_ns, content)
+        return content
+
     def load_config(self):
         """
         Load the configuration from a JSON file.
@@ -711,9 +934,8 @@ class Factory:
             - load_config() -> {'setting1': 'value1', 'setting2': 'value2'}
         """
         try:
-            with open(self.config_path, 'r') as file:
-                content = json.load(file)
-                return content
+            self._config = self._read_json(self.config_path)
+            return self._config
         except Exception as e:
             print(f"FLCO1 - Error while loading config: {e}")
             traceback.print_exc()
@@ -736,8 +958,15 @@ class Factory:
 
             if not (db_path).exists():
                 raise FileNotFoundError("FDB3 - Database not found.")
+            conn = None
             try:
                 conn = sqlite3.connect(db_path)
+                conn.executescript(
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA temp_store=MEMORY;"
+                    "PRAGMA cache_size=-65536;"
+                )
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -754,6 +983,11 @@ class Factory:
             except Exception as e:
                 print(f"FDB1 - Error while loading database: {e}")
                 traceback.print_exc()
+                # The connection never reached self.db_conn; close it here or
+                # the descriptor leaks in every worker that hits this path.
+                if conn is not None:
+                    with suppress(Exception):
+                        conn.close()
                 raise e
 
     def load_custom_preloading(self):
@@ -767,9 +1001,7 @@ class Factory:
             Exception: If there is an error while loading the custom preloading.
         """
         try:
-            with open(self.custom_preloading_path, 'r') as file:
-                content = json.load(file)
-                return content
+            return self._read_json(self.custom_preloading_path)
         except Exception as e:
             print(f"LCP1 - Error while loading custom preloading: {e}")
             traceback.print_exc()
@@ -786,10 +1018,14 @@ class Factory:
             - instance.get_output_folder() -> '/path/to/output_directory'
         """
         try:
+            if self._output_folder is not None:
+                return self._output_folder
             config = self.load_config()
             if not config.get('OUTPUT_DIR'):
-                return os.path.abspath(os.path.join(self.ocwd, "results"))
-            return config['OUTPUT_DIR']
+                self._output_folder = os.path.abspath(os.path.join(self.ocwd, "results"))
+            else:
+                self._output_folder = config['OUTPUT_DIR']
+            return self._output_folder
         except Exception as e:
             print("GOF1 - Error while getting output folder.")
             traceback.print_exc()
@@ -810,7 +1046,11 @@ class Factory:
             custom_entry = preloading_config['customEntry']
             if custom_entry:
                 try:
-                    custom_entry = custom_entry.split(',')
+                    # Normalize once: stripped, deduplicated prefixes ready for
+                    # the single-pass startswith(tuple) filters downstream.
+                    custom_entry = tuple(dict.fromkeys(
+                        prefix.strip() for prefix in custom_entry.split(',') if prefix.strip()
+                    ))
                     selected_option = preloading_config.get('selectedOption')
                     export_separation = preloading_config.get('exportSeparation')
                     if selected_option == 'selectOnly':
@@ -823,8 +1063,7 @@ class Factory:
                     print(f"FPL1 - Error while performing preloading: {e}")
                     return False
             else:
-                if DEBUG:
-                    print("DEBUG - No custom entry found in preloading configuration.")
+                logger.debug("No custom entry found in preloading configuration.")
                 pass
         else:
             pass
@@ -833,6 +1072,10 @@ class Factory:
         """
         Selects only the images whose filenames start with the specified values.
 
+        The filter is kept in memory and applied by load_images during its
+        directory scan; when images are already loaded, the dictionary is
+        narrowed in place instead of rescanning the upload folder.
+
         Args:
             values (list): A list of strings representing the desired starting values of the filenames.
 
@@ -840,14 +1083,8 @@ class Factory:
             None
         """
         try:
-            images = self.load_images()
-            allowed_images = set()
-            for value in values:
-                allowed_images.update([i for i in images if i.startswith(value)])
-            for image in images:
-                if image not in allowed_images:
-                    os.remove(os.path.join(self.upload_folder, image))
-            pass
+            self._allowed_prefixes = tuple(values)
+            self._apply_prefix_filters()
         except Exception as e:
             print(f"FPL2 - Error while selecting images: {e}")
             raise BaseException(e)
@@ -855,7 +1092,11 @@ class Factory:
 
     def exclude_only(self, values):
         """
-        Removes images from the upload folder that start with the specified values.
+        Excludes images whose filenames start with the specified values.
+
+        The filter is kept in memory and applied by load_images during its
+        directory scan; when images are already loaded, the dictionary is
+        narrowed in place instead of rescanning the upload folder.
 
         Args:
             values (list): A list of strings representing the values to match the image names.
@@ -864,17 +1105,34 @@ class Factory:
             None
         """
         try:
-            images = self.load_images()
-            for value in values:
-                for image in images:
-                    if image.startswith(value):
-                        os.remove(os.path.join(self.upload_folder, image))
-            pass
+            self._excluded_prefixes = tuple(values)
+            self._apply_prefix_filters()
         except Exception as e:
             print(f"FPL3 - Error while excluding images: {e}")
             raise BaseException(e)
         self.verify_preprocessed_images()
 
+    def _apply_prefix_filters(self):
+        """
+        Narrows the loaded image dictionary to the current prefix filters.
+
+        Filters in place when images are already loaded, avoiding a rescan of
+        the upload folder; falls back to load_images when nothing is loaded yet.
+        """
+        if not self.images:
+            self.load_images()
+            return
+        for name in [
+            name for name in self.images
+            if (self._excluded_prefixes and name.startswith(self._excluded_prefixes))
+            or (self._allowed_prefixes and not name.startswith(self._allowed_prefixes))
+        ]:
+            del self.images[name]
+        if not self.images:
+            print("FLI5 - No images found.")
+            raise FileNotFoundError("FLI3 - No images found.")
+        self._image_paths = tuple(self.images.values())
+
     def load_export_separation(self) -> Union[int, bool]:
         """
         Loads the export separation configuration.
@@ -953,9 +1211,21 @@ class Factory:
                 traceback.print_exc()
                 raise ValueError("FLI2 - Invalid images dictionary.")
 
-            for filename in os.listdir(self.upload_folder):
-                if filename.split('.')[-1].lower() in ALLOWED_EXTENSIONS:
-                    self.images[filename] = os.path.join(self.upload_folder, filename)
+            if self.images:
+                # Already populated (e.g. by a preloading filter); the dictionary
+                # is authoritative, so skip the redundant directory scan.
+                return self.images
+
+            with os.scandir(self.upload_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not entry.is_file() or not name.lower().endswith(ALLOWED_SUFFIXES):
+                        continue
+                    if self._excluded_prefixes and name.startswith(self._excluded_prefixes):
+                        continue
+                    if self._allowed_prefixes and not name.startswith(self._allowed_prefixes):
+                        continue
+                    self.images[name] = entry.path
 
             if not self.images:
                 print("FLI5 - No images found.")
@@ -1039,39 +1309,54 @@ class Factory:
             table_name = config['DB_NAME']
 
             # Verificar as colunas existentes na tabela do banco de dados
-            self.db_cursor.execute(f"PRAGMA table_info({table_name});")
-            existing_columns = [info[1] for info in self.db_cursor.fetchall()]
+            if self._db_columns is None:
+                self.db_cursor.execute(f'PRAGMA table_info("{table_name}");')
+                self._db_columns = {info[1] for info in self.db_cursor.fetchall()}
 
+            missing_columns = [col for col in results.columns if col not in self._db_columns]
             try:
-                for col in results.columns:
-                    if col not in existing_columns:
-                        self.db_cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {col} TEXT;")
+                if missing_columns:
+                    self.db_conn.execute("BEGIN;")
+                    for col in missing_columns:
+                        self.db_cursor.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{col}" TEXT;')
+                    self.db_conn.commit()
+                    self._db_columns.update(missing_columns)
             except Exception as e:
                 print(f"FBSQL3 - Erro ao adicionar colunas: {e}")
                 traceback.print_exc()
                 raise e
 
-            for index, row in results.iterrows():
-                image_name = row['image']
+            columns = list(results.columns)
+            image_idx = columns.index('image')
 
-                self.db_cursor.execute(f"SELECT 1 FROM {table_name} WHERE image = ?", (image_name,))
-                exists = self.db_cursor.fetchone()
-                try:
-                    if exists:
-                        update_placeholders = ', '.join([f"{col} = ?" for col in row.index if col != 'image'])
-                        update_sql = f"UPDATE {table_name} SET {update_placeholders} WHERE image = ?"
-                        self.db_cursor.execute(update_sql, tuple(row[col] for col in row.index if col != 'image') + (image_name,))
-                    else:
-                        columns = ', '.join(row.index)
-                        placeholders = ', '.join(['?'] * len(row))
-                        insert_sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-                        self.db_cursor.execute(insert_sql, tuple(row))
-                except Exception as e:
-                    print(f"FBSQL4 - Erro ao inserir/atualizar dados: {e}")
-                    traceback.print_exc()
-                    raise e
+            self.db_cursor.execute(f'SELECT image FROM "{table_name}";')
+            existing_images = {entry[0] for entry in self.db_cursor.fetchall()}
+
+            update_rows = []
+            insert_rows = []
+            for row in results.itertuples(index=False, name=None):
+                if row[image_idx] in existing_images:
+                    update_rows.append(tuple(value for idx, value in enumerate(row) if idx != image_idx) + (row[image_idx],))
+                else:
+                    insert_rows.append(row)
+
+            try:
+                self.db_conn.execute("BEGIN;")
+                if update_rows:
+                    update_placeholders = ', '.join([f'"{col}" = ?' for col in columns if col != 'image'])
+                    update_sql = f'UPDATE "{table_name}" SET {update_placeholders} WHERE image = ?'
+                    self.db_cursor.executemany(update_sql, update_rows)
+                if insert_rows:
+                    placeholders = ', '.join(['?'] * len(columns))
+                    quoted_columns = ', '.join(f'"{col}"' for col in columns)
+                    insert_sql = f'INSERT INTO "{table_name}" ({quoted_columns}) VALUES ({placeholders})'
+                    self.db_cursor.executemany(insert_sql, insert_rows)
+                self.db_conn.commit()
+            except Exception as e:
+                print(f"FBSQL4 - Erro ao inserir/atualizar dados: {e}")
+                traceback.print_exc()
+                raise e
 
-            self.db_conn.commit()
             self.db_conn.close()
 
         except AttributeError as e:
@@ -1099,38 +1384,35 @@ class Factory:
         """
         try:
             output_folder = self.get_output_folder()
-            if DEBUG:
-                print(f"DEBUG - Output_folder: {output_folder}")
+            logger.debug("Output_folder: %s", output_folder)
 
             separate_position = self.load_export_separation()
 
-            results_dict = {}
-
-            for image, model, result in results:
-                if image not in results_dict:
-                    results_dict[image] = {}
-                results_dict[image][model] = result
-
-            results_pd = pd.DataFrame.from_dict(results_dict, orient='index').reset_index()
-            results_pd.rename(columns={'index': 'image'}, inplace=True)
+            results_long = pd.DataFrame(results, columns=['image', 'model', 'result'])
 
             if self.exportation_formats.get('connected_database', False):
+                # Duplicate (image, model) pairs arise when source files share
+                # a stem across extensions; last wins, matching the exporters.
+                results_pd = results_long.drop_duplicates(
+                    subset=['image', 'model'], keep='last'
+                ).pivot(
+                    index='image', columns='model', values='result'
+                ).reset_index().rename_axis(columns=None)
                 self.load_database()
                 self.export_connecteddb(results_pd)
 
-            if DEBUG:
-                print(f"DEBUG - Exporting results: {results_dict}")
-                print("DEBUG - Calling ResultsExporter with those parameters:")
-                print(f"DEBUG - Exportation formats: {self.exportation_formats}")
-                print(f"DEBUG - Output folder: {output_folder}")
-                print(f"DEBUG - Separate exports: {separate_position}")
+            logger.debug("Exporting results: %s", results_long)
+            logger.debug("Calling ResultsExporter with those parameters:")
+            logger.debug("Exportation formats: %s", self.exportation_formats)
+            logger.debug("Output folder: %s", output_folder)
+            logger.debug("Separate exports: %s", separate_position)
 
             exporter = ResultsExporter(
                 exportation_formats=self.exportation_formats,
                 output_folder=output_folder,
                 separate_exports=separate_position
             )
-            exporter.export_results(results_dict)
+            exporter.export_results(results_long)
         except Exception as e:
             print(f"FPEXR - Error during export_results: {e}")
             traceback.print_exc()
@@ -1139,12 +1421,14 @@ class Factory:
     def execute_recipe(self):
         """
         Executes the loaded recipes sequentially and stores the results.
+
+        This is the sequential fallback path: parallel execution over models is
+        handled by execute_recipes_parallel, which is attempted first.
         Returns:
             If an error occurs while loading the binary, the exception is returned.
             If an error occurs while executing a command, the exception is returned.
         """
-        if DEBUG:
-            print("DEBUG - Executing recipe...")
+        logger.debug("Executing recipe...")
         additional_parameter = []
         sequential_results = []
         self.white_background = self.commands_spec.get('white_background', False)
@@ -1152,48 +1436,40 @@ class Factory:
         try:
             for command, value in self.commands.items():
                 if value:
-                    if DEBUG:
-                        print(f"DEBUG - Executing command {command}...")
+                    logger.debug("Executing command %s...", command)
                     binary_path = self._get_binary_path(command)
                     print(binary_path)
                     if binary_path:
+                        image_path = list(self.images.values())
                         try:
-                            image_path = list(self.images.values())
-                            try:
-                                if DEBUG:
-                                    print(f"DEBUG - Executing BIN of {command}...")
-                                full_command = [binary_path] + image_path
-                                print(full_command)
-                                result = subprocess.check_output(full_command)
-                                if DEBUG:
-                                    print([binary_path] + additional_parameter + image_path)
-                                result = result.decode('utf-8').strip()
-                                result_lines = result.split('\n')
-                                for line in result_lines:
-                                    parts = line.split(" Result: ")
-                                    if len(parts) == 2:
-                                        image_filename = os.path.basename(parts[0].split(": ")[1]).strip(" -")
-                                        image_filename = os.path.splitext(image_filename)[0]
-                                        result_values = parts[1].replace('*', '').strip()
-                                        sequential_results.append((image_filename, command, result_values))
-                            except Exception as e:
-                                print(f"FBIN2 - Error while executing {command}: {e}")
-                                traceback.print_exc()
-                                raise e
-                        finally:
-                            os.chdir(self.ocwd)
+                            logger.debug("Executing BIN of %s...", command)
+                            full_command = [binary_path] + image_path
+                            print(full_command)
+                            logger.debug("%s", [binary_path] + additional_parameter + image_path)
+                            append_result = sequential_results.append
+                            with subprocess.Popen(full_command, cwd=self.models_path, stdout=subprocess.PIPE, text=True, bufsize=1) as proc:
+                                for line in proc.stdout:
+                                    match = RESULT_LINE_RE.match(line.strip())
+                                    if match:
+                                        image_filename = match.group(2).strip(" -").rpartition('/')[2].rpartition('\\')[2]
+                                        image_filename = image_filename.rpartition('.')[0] or image_filename
+                                        result_values = match.group(3).replace('*', '').strip()
+                                        append_result((image_filename, command, result_values))
+                                if proc.wait() != 0:
+                                    raise subprocess.CalledProcessError(proc.returncode, full_command)
+                        except Exception as e:
+                            print(f"FBIN2 - Error while executing {command}: {e}")
+                            traceback.print_exc()
+                            raise e
                     else:
                         print(f"FBIN3 - Model {command} not found.")
-                        os.chdir(self.ocwd)
                 else:
-                    if DEBUG:
-                        print(f"DEBUG - Skipping command {command}...")
+                    logger.debug("Skipping command %s...", command)
         except Exception as e:
             print(f"FER1 - Error while executing recipe: {e}")
             traceback.print_exc()
         finally:
-            if DEBUG:
-                print("DEBUG - Exporting results...")
+            logger.debug("Exporting results...")
             self.export_results(sequential_results)
 
     def _get_binary_path(self, command):
@@ -1213,42 +1489,125 @@ class Factory:
         if command == 'root_color' or 'root_advanced_color':
             if self.white_background:
                 additional_parameter = " --whitebg "
-                if DEBUG:
-                    print(f"DEBUG - Additional parameter: {additional_parameter}")
+                logger.debug("Additional parameter: %s", additional_parameter)
         try:
-            binary_path = os.path.join(Path(self.models_path).resolve(), command + ".exe")
+            binary_path = self._binary_index.get(command)
+            if binary_path is None:
+                binary_path = _binary_path_for(command, self._models_dir_str)
             additional_parameter = additional_parameter if 'additional_parameter' in locals() else ""
             binary_path = binary_path + additional_parameter
-            if DEBUG:
-                print(f"DEBUG - Binary path: {binary_path}")
+            logger.debug("Binary path: %s", binary_path)
             return binary_path
         except Exception as e:
             traceback.print_exc()
             raise RuntimeError(f"FBIN1_P - Error while loading binary: {e}")
 
-    def _run_subprocess(self, binary_path, batch):
-        """Run the subprocess for a batch of images.
+    def _run_subprocess(self, binary_path, batch, cwd=None):
+        """Run the subprocess for a batch of images, streaming its output.
 
         Args:
             binary_path (str): The path to the binary executable.
             batch (list): A list of image paths to process.
+            cwd (str, optional): Working directory for the child process.
 
-        Returns:
-            list: A list of strings representing the output of the subprocess.
+        Yields:
+            str: Output lines as the binary produces them, so parsing can
+            start before the process exits and the full output is never
+            buffered twice.
 
         Raises:
             subprocess.CalledProcessError: If the subprocess returns a non-zero exit status.
 
         """
-        """Run the subprocess for a batch of images."""
+        full_command = [binary_path, *batch]
         try:
-            result = subprocess.check_output([binary_path] + batch)
-            return result.decode('utf-8').strip().split('\n')
+            with subprocess.Popen(full_command, stdout=subprocess.PIPE, text=True, bufsize=1, cwd=cwd) as proc:
+                for line in proc.stdout:
+                    yield line.rstrip('\n')
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, full_command)
         except subprocess.CalledProcessError as e:
             print(f"FRSB1 - Subprocess error: {e}")
             traceback.print_exc()
             raise e
 
+    def _run_subprocess_buffered(self, binary_path, batch, cwd=None):
+        """Materializes _run_subprocess output into a list.
+
+        Used where the subprocess must run to completion on a worker thread
+        rather than lazily on the consumer.
+        """
+        return list(self._run_subprocess(binary_path, batch, cwd))
+
+    def _run_with_halving(self, binary_path, batch, cwd=None):
+        """Runs a batch, recursively halving it on failure to isolate bad images.
+
+        A failing batch is split in two and each half retried, so a single
+        offending image is narrowed down in O(log N) subprocess calls while
+        every healthy image still gets processed. A one-image batch that
+        still fails is reported and skipped.
+
+        Args:
+            binary_path (str): The path to the binary executable.
+            batch (list): Image paths to process.
+            cwd (str, optional): Working directory for the child process.
+
+        Returns:
+            list: Output lines from all successful sub-batches.
+        """
+        try:
+            return self._run_subprocess_buffered(binary_path, batch, cwd)
+        except Exception as e:
+            if len(batch) == 1:
+                print(f"FBIN2_P - Image failed after batch halving: {batch[0]}: {e}")
+                return []
+            mid = len(batch) // 2
+            result_lines = self._run_with_halving(binary_path, batch[:mid], cwd)
+            result_lines.extend(self._run_with_halving(binary_path, batch[mid:], cwd))
+            return result_lines
+
+    def _run_with_worker(self, binary_path, image_paths, command, cwd=None):
+        """Run all batches for a command through a long-lived worker process.
+
+        Instead of spawning one subprocess per batch (paying weight-load and
+        runtime-init cost each time), the binary is started once with stdin and
+        stdout pipes and fed image paths line by line; it is expected to emit
+        one result line per image. The worker is kept in self._workers and
+        reused across calls for the same command. Enabled via the
+        PERSISTENT_WORKERS configuration flag; binaries that do not speak the
+        stdin protocol are handled by the caller's fallback to the one-shot
+        path.
+
+        Args:
+            binary_path (str): The path to the binary executable.
+            image_paths (list): All image paths to process.
+            command (str): The command being executed.
+            cwd (str, optional): Working directory for the worker process.
+
+        Returns:
+            list: Processed result tuples, as produced by _process_results.
+
+        Raises:
+            RuntimeError: If the worker exits before producing a result line.
+        """
+        results = []
+        proc = self._workers.get(command)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen([binary_path], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1, cwd=cwd)
+            self._workers[command] = proc
+        for i in range(0, len(image_paths), self.batch_size):
+            batch = image_paths[i:i + self.batch_size]
+            proc.stdin.write('\n'.join(batch) + '\n')
+            proc.stdin.flush()
+            result_lines = []
+            for _ in batch:
+                line = proc.stdout.readline()
+                if not line:
+                    raise RuntimeError(f"FWRK1 - Worker for {command} exited before emitting all results.")
+                result_lines.append(line.rstrip('\n'))
+            results.extend(self._process_results(result_lines, command))
+        return results
+
     def _process_results(self, result_lines, command):
         """Process the result lines from the subprocess.
 
@@ -1265,15 +1624,15 @@ class Factory:
         """
         """Process the result lines from the subprocess."""
         results = []
+        append_result = results.append
         for line in result_lines:
-            parts = line.split(" Result: ")
-            if len(parts) == 2:
-                image_filename = os.path.basename(parts[0].split(": ")[1]).strip(" -")
-                image_filename = os.path.splitext(image_filename)[0]
-                result_values = parts[1].replace('*', '').strip()
-                results.append((image_filename, command, result_values))
-                if DEBUG:
-                    print(f"DEBUG - Processed result for {image_filename}: {result_values}")
+            match = RESULT_LINE_RE.match(line)
+            if match:
+                image_filename = match.group(2).strip(" -").rpartition('/')[2].rpartition('\\')[2]
+                image_filename = image_filename.rpartition('.')[0] or image_filename
+                result_values = match.group(3).translate(STAR_STRIP_TABLE).strip()
+                append_result((image_filename, command, result_values))
+                logger.debug("Processed result for %s: %s", image_filename, result_values)
         return results
 
     def _execute_command(self, command):
@@ -1295,77 +1654,218 @@ class Factory:
 
 
         """
-        if DEBUG:
-            print(f"DEBUG - Process {current_process().name} - Executing command {command}...")
+        logger.debug("Process %s - Executing command %s...", current_process().name, command)
 
         try:
-            config = self.load_config()
+            # Workers inherit the parent's parsed config through pickling;
+            # only load from disk if this instance never read it.
+            config = self._config if self._config is not None else self.load_config()
             binary_path = self._get_binary_path(command)
             if not binary_path:
-                if DEBUG:
-                    print(f"DEBUG - Model {command} not found.")
+                logger.debug("Model %s not found.", command)
                 return [(f"FBIN3_P Model {command} not found.",)]
 
-            image_paths = list(self.images.values())
+            image_paths = self._image_paths
             results = []
 
             binary_dir = os.path.dirname(binary_path)
 
-            with Utils().change_directory(binary_dir):
-                if config['FORCE_MAXPERFORMANCE']:
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future_to_batch = {executor.submit(self._run_subprocess, binary_path, image_paths[i:i + self.batch_size]): i for i in range(0, len(image_paths), self.batch_size)}
-                        for future in concurrent.futures.as_completed(future_to_batch):
-                            batch_index = future_to_batch[future]
-                            try:
-                                result_lines = future.result()
-                                results.extend(self._process_results(result_lines, command))
-                            except Exception as e:
-                                if DEBUG:
-                                    print(f"DEBUG - Error while executing {command} on batch {batch_index}, retrying with smaller batch: {e}")
-                                # Retry logic for smaller batch
-                                for j in range(batch_index, batch_index + self.batch_size, self.batch_size // 2):
-                                    retry_batch = image_paths[j:j + self.batch_size // 2]
-                                    if DEBUG:
-                                        print(f"DEBUG - Retrying with smaller batch {j // (self.batch_size // 2) + 1}: {retry_batch}")
-                                    try:
-                                        result_lines = self._run_subprocess(str(binary_path), retry_batch)
-                                        results.extend(self._process_results(result_lines, command))
-                                    except Exception as retry_e:
-                                        traceback.print_exc()
-                                        raise RuntimeError(f"FBIN2_P - Error while retrying smaller batch: {retry_e}")
-                else:
-                    for i in range(0, len(image_paths), self.batch_size):
-                        batch = image_paths[i:i + self.batch_size]
-                        if DEBUG:
-                            print(f"DEBUG - Processing batch {i // self.batch_size + 1}: {batch}")
-                        try:
-                            result_lines = self._run_subprocess(binary_path, batch)
-                            results.extend(self._process_results(result_lines, command))
-                        except Exception as e:
-                            if DEBUG:
-                                print(f"DEBUG - Error while executing {command} on batch, retrying with smaller batch: {e}")
-                            # Retry logic for smaller batch
-                            for j in range(i, i + self.batch_size, self.batch_size // 2):
-                                retry_batch = image_paths[j:j + self.batch_size // 2]
-                                if DEBUG:
-                                    print(f"DEBUG - Retrying with smaller batch {j // (self.batch_size // 2) + 1}: {retry_batch}")
-                                try:
-                                    result_lines = self._run_subprocess(binary_path, retry_batch)
-                                    results.extend(self._process_results(result_lines, command))
-                                except Exception as retry_e:
-                                    if DEBUG:
-                                        print(f"DEBUG - Error during retry: {retry_e}")
-                                    results.append(
-                                        (f"FBIN2_P - Error while retrying smaller batch: {retry_e}",)
-                                    )
+            if config.get('PERSISTENT_WORKERS', False):
+                try:
+                    results.extend(self._run_with_worker(binary_path, image_paths, command, binary_dir))
+                    return results
+                except Exception as e:
+                    logger.debug("Persistent worker for %s failed, falling back to one-shot execution: %s", command, e)
+                    # Reap the broken worker here; once popped, shutdown() can
+                    # no longer see it and the process would outlive the app.
+                    worker = self._workers.pop(command, None)
+                    if worker is not None:
+                        with suppress(Exception):
+                            worker.stdin.close()
+                        with suppress(Exception):
+                            worker.stdout.close()
+                        if worker.poll() is None:
+                            worker.terminate()
+                        with suppress(Exception):
+                            worker.wait(timeout=5)
+
+            if config['FORCE_MAXPERFORMANCE']:
+                # The subprocesses themselves are the parallel unit: a bounded
+                # window of non-blocking Popen handles keeps four batches in
+                # flight with no thread overhead and no GIL contention while
+                # results are parsed.
+                max_inflight = 4
+                inflight = []
+
+                def _collect_batch(batch, proc):
+                    stdout, _ = proc.communicate()
+                    if proc.returncode != 0:
+                        logger.debug("Error while executing %s on batch, retrying with halving: exit %s", command, proc.returncode)
+                        result_lines = self._run_with_halving(binary_path, batch, binary_dir)
+                    else:
+                        result_lines = stdout.splitlines()
+                    results.extend(self._process_results(result_lines, command))
+
+                for i in range(0, len(image_paths), self.batch_size):
+                    batch = list(image_paths[i:i + self.batch_size])
+                    try:
+                        proc = subprocess.Popen([binary_path, *batch], stdout=subprocess.PIPE, text=True, cwd=binary_dir)
+                    except Exception as e:
+                        logger.debug("Error while launching %s on batch, retrying with halving: %s", command, e)
+                        result_lines = self._run_with_halving(binary_path, batch, binary_dir)
+                        results.extend(self._process_results(result_lines, command))
+                        continue
+                    inflight.append((batch, proc))
+                    if len(inflight) >= max_inflight:
+                        _collect_batch(*inflight.pop(0))
+                while inflight:
+                    _collect_batch(*inflight.pop(0))
+            else:
+                for i in range(0, len(image_paths), self.batch_size):
+                    batch = image_paths[i:i + self.batch_size]
+                    logger.debug("Processing batch %s: %s", i // self.batch_size + 1, batch)
+                    try:
+                        result_lines = self._run_subprocess(binary_path, batch, binary_dir)
+                        results.extend(self._process_results(result_lines, command))
+                    except Exception as e:
+                        logger.debug("Error while executing %s on batch, retrying with halving: %s", command, e)
+                        result_lines = self._run_with_halving(binary_path, batch, binary_dir)
+                        results.extend(self._process_results(result_lines, command))
 
         except Exception as outer_e:
-            if DEBUG:
-                print(f"DEBUG - Outer exception caught: {outer_e}")
+            logger.debug("Outer exception caught: %s", outer_e)
 
         return results
 
+    def _count_uploads(self):
+        """
+        Counts entries in the upload folder with a single scandir pass.
+        Returns:
+            - int: Number of directory entries, without materializing a name list.
+        """
+        with os.scandir(self.upload_folder) as entries:
+            return sum(1 for _ in entries)
+
+    def _wait_for_uploads(self, expected_images):
+        """
+        Blocks until the upload folder holds the expected number of images.
+
+        When the optional watchdog package is installed, an observer wakes
+        this method exactly when new files land instead of re-scanning the
+        directory every second; otherwise it falls back to polling with
+        exponential backoff.
+
+        Parameters:
+            - expected_images (int): Number of images expected in the upload folder.
+        Returns:
+            - None
+        """
+        if self._count_uploads() >= expected_images:
+            return
+
+        if Observer is not None:
+            created = threading.Event()
+
+            class _UploadEventHandler(FileSystemEventHandler):
+                def on_created(self, event):
+                    created.set()
+
+            observer = Observer()
+            observer.schedule(_UploadEventHandler(), str(self.upload_folder))
+            observer.start()
+            try:
+                while True:
+                    copied_images = self._count_uploads()
+                    if copied_images >= expected_images:
+                        break
+                    logger.debug("Waiting for images to be copied... %s images remaining.", expected_images - copied_images)
+                    created.wait(timeout=16)
+                    created.clear()
+            finally:
+                observer.stop()
+                observer.join()
+        else:
+            wait_time = 1
+            copied_images = self._count_uploads()
+            while copied_images < expected_images:
+                logger.debug("Waiting for images to be copied... %s images remaining.", expected_images - copied_images)
+                time.sleep(wait_time)
+                wait_time = min(wait_time * 2, 16)
+                copied_images = self._count_uploads()
+
+    def _execute_batch(self, task):
+        """
+        Executes a single (command, batch) work unit.
+
+        Finer-grained than _execute_command: when recipes are fewer than
+        cores, dispatching these units with dynamic scheduling keeps every
+        core busy and stops one slow model from serializing the run.
+
+        Args:
+            task (tuple): A (command, batch) pair, where batch is a sequence
+                of image paths.
+
+        Returns:
+            list: Processed result tuples, or a single error tuple on failure.
+        """
+        command, batch = task
+        logger.debug("Process %s - Executing batch for command %s...", current_process().name, command)
+        try:
+            binary_path = self._get_binary_path(command)
+            if not binary_path:
+                return [(f"FBIN3_P Model {command} not found.",)]
+            binary_dir = os.path.dirname(binary_path)
+            try:
+                result_lines = self._run_subprocess(binary_path, list(batch), binary_dir)
+                return self._process_results(result_lines, command)
+            except Exception as e:
+                logger.debug("Error while executing %s batch, retrying with halving: %s", command, e)
+                result_lines = self._run_with_halving(binary_path, list(batch), binary_dir)
+                return self._process_results(result_lines, command)
+        except Exception as e:
+            return [(f"FBIN2_P - Error while executing batch for {command}: {e}",)]
+
+    def _calibrate_batch_size(self, command):
+        """
+        Probes candidate batch sizes and keeps the one with the best throughput.
+
+        Runs the given command over a small sample of the loaded images at each
+        candidate size, times the runs, and sets self.batch_size to the size
+        with the highest images-per-second rate. Enabled by the
+        CALIBRATE_BATCH_SIZE config flag; runs at most once per Factory.
+
+        Args:
+            command (str): Name of an enabled recipe command to probe with.
+
+        Returns:
+            int: The selected batch size.
+        """
+        candidates = (1, 4, 16, 64)
+        try:
+            binary_path = self._get_binary_path(command)
+            if not binary_path:
+                return self.batch_size
+            binary_dir = os.path.dirname(binary_path)
+            best_size, best_rate = self.batch_size, 0.0
+            for size in candidates:
+                sample = list(self._image_paths[:size])
+                if len(sample) < size:
+                    break
+                start = time.perf_counter()
+                list(self._run_subprocess(binary_path, sample, binary_dir))
+                elapsed = time.perf_counter() - start
+                rate = size / elapsed if elapsed > 0 else 0.0
+                logger.debug("Batch calibration: size %d ran at %.2f images/s", size, rate)
+                if rate > best_rate:
+                    best_size, best_rate = size, rate
+            if best_rate > 0.0:
+                self.batch_size = best_size
+                logger.debug("Batch calibration selected batch size %d", best_size)
+        except Exception as e:
+            # Calibration is best-effort; the configured batch size still works.
+            logger.debug("Batch calibration failed, keeping batch size %d: %s", self.batch_size, e)
+        return self.batch_size
+
     def execute_recipes_parallel(self):
         """
         Executes the loaded recipes in parallel using multiprocessing.Pool.
@@ -1376,48 +1876,100 @@ class Factory:
         """
         self.true_commands = [command for command, value in self.commands.items() if value]
         expected_images = len(self.images)
-        copied_images = set(os.listdir(self.upload_folder))
 
         try:
-            wait_time = 1
-            while len(copied_images) < expected_images:
-                if DEBUG:
-                    missing_images = expected_images - len(copied_images)
-                    print(
-                        f"DEBUG - Waiting for images to be copied... "
-                        f"{missing_images} images remaining."
-                    )
-                time.sleep(wait_time)
-                wait_time = min(wait_time * 2, 16)
-                copied_images = set(os.listdir(self.upload_folder))
-
+            self._wait_for_uploads(expected_images)
         except Exception as e:
             print(f"FPAR2 - Error while waiting for images to be copied: {e}")
             traceback.print_exc()
             return e
 
-        if DEBUG:
-            print("DEBUG - All images copied, proceeding to parallel execution of recipes...")
+        logger.debug("All images copied, proceeding to parallel execution of recipes...")
+
+        if self.true_commands and not self._batch_calibrated:
+            try:
+                if self.load_config().get('CALIBRATE_BATCH_SIZE'):
+                    self._calibrate_batch_size(self.true_commands[0])
+            except Exception:
+                pass
+            self._batch_calibrated = True
+
+        if len(self.true_commands) <= 1:
+            # A single command gains nothing from the Pool; run it in-process
+            # and skip worker startup and pickling entirely.
+            logger.debug("Single command recipe, executing in-process.")
+            try:
+                results = [self._execute_command(command) for command in self.true_commands]
+            except Exception as e:
+                print(f"FPAR3 - Error while executing recipes in parallel: {e}")
+                traceback.print_exc()
+                return e
+            return self._export_parallel_results(results)
+
+        # When there are fewer commands than cores and enough images for
+        # several batches, per-command tasks leave cores idle; decompose to
+        # (command, batch) units so dynamic scheduling balances uneven
+        # per-model costs across the whole machine.
+        available_cores = _physical_cpu_count()
+        use_batch_tasks = len(self.true_commands) < available_cores and len(self._image_paths) > self.batch_size
+        if use_batch_tasks:
+            work_items = [
+                (command, self._image_paths[i:i + self.batch_size])
+                for command in self.true_commands
+                for i in range(0, len(self._image_paths), self.batch_size)
+            ]
+            worker = _worker_execute_batch
+        else:
+            work_items = self.true_commands
+            worker = _worker_execute_command
 
-        num_processes = min(cpu_count(), len(self.true_commands))  # Optimize the number of processes
+        num_processes = max(1, min(available_cores, len(work_items)))  # Optimize the number of processes
 
         try:
-            with Pool(processes=num_processes) as pool:
-                if DEBUG:
-                    print(f"DEBUG - Starting parallel execution with {num_processes} processes.")
-
-                if PERFORM_BENCHMARK:
-                    print("Benchmarking parallel execution...")
-                    with self.utils.benchmark_time("Executing commands in parallel"):
-                        results = pool.map(self._execute_command, self.true_commands)
-                else:
-                    results = pool.map(self._execute_command, self.true_commands)
+            pool = self._get_pool(num_processes)
+            chunksize = 1 if use_batch_tasks else max(1, len(work_items) // (num_processes + 2))
+            logger.debug("Starting parallel execution with %s processes (chunksize=%s).", num_processes, chunksize)
+
+            # imap_unordered streams each command's results as its worker
+            # finishes, so flattening overlaps with the slower workers instead
+            # of waiting for the full map to materialize. Each per-command
+            # list is also garbage-collected right after its extend, so peak
+            # memory holds one command's results rather than all of them.
+            sequential_results = []
+
+            def _consume(result_iter):
+                for result in result_iter:
+                    if isinstance(result, list):
+                        sequential_results.extend(result)
+                    else:
+                        print(f"FPAR1 - Warning: Expected a list result, got {type(result)} instead.")
+
+            # One dispatch shared by both branches: the benchmark only wraps
+            # consumption, so the workload cannot be submitted twice.
+            result_iter = pool.imap_unordered(worker, work_items, chunksize=chunksize)
+            if PERFORM_BENCHMARK:
+                print("Benchmarking parallel execution...")
+                with self.utils.benchmark_time("Executing commands in parallel"):
+                    _consume(result_iter)
+            else:
+                _consume(result_iter)
         except Exception as e:
             print(f"FPAR3 - Error while executing recipes in parallel: {e}")
             traceback.print_exc()
             return e
 
-        # Flatten results and handle errors
+        logger.debug("Recipes executed in parallel successfully, proceeding to export.")
+        logger.debug("Parallel results: %s", sequential_results)
+        self.export_results(sequential_results)
+
+    def _export_parallel_results(self, results):
+        """
+        Flattens per-command result lists and exports them.
+        Parameters:
+            - results (list): A list of per-command result lists.
+        Returns:
+            - None on success, or the exception raised while flattening.
+        """
         sequential_results = []
         for result in results:
             try:
@@ -1430,9 +1982,8 @@ class Factory:
                 traceback.print_exc()
                 return e
 
-        if DEBUG:
-            print("DEBUG - Recipes executed in parallel successfully, proceeding to export.")
-            print(f"DEBUG - Parallel results: {sequential_results}")
+        logger.debug("Recipes executed in parallel successfully, proceeding to export.")
+        logger.debug("Parallel results: %s", sequential_results)
         self.export_results(sequential_results)
 
 